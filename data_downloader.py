@@ -8,59 +8,267 @@ Author: Healthcare AI Team
 Date: August 2025
 """
 
+import importlib.util
+import json
 import os
 import requests
-import zipfile
-import gdown
 from pathlib import Path
 import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from urllib3.util.retry import Retry
+
+# Shared HTTP session so keep-alive connections are reused across fallback
+# URLs and datasets instead of paying a fresh TCP/TLS handshake every time.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.headers.update({"User-Agent": "healthcare-ai-downloader/1.0"})
+
+# Downloads are copied to disk in 1 MiB chunks; progress bars only refresh
+# after at least 4 MiB has arrived.
+CHUNK_SIZE = 1 << 20
+PROGRESS_INTERVAL = 4 << 20
+
+# Written into an archive's extract_to once extraction has finished, so an
+# interrupted extraction is never mistaken for a complete dataset.
+COMPLETE_MARKER = ".download_complete"
+
+# Written before extraction starts and removed with COMPLETE_MARKER in place,
+# so a tree left half extracted by an interrupted run is recognised as such.
+INCOMPLETE_MARKER = ".extracting"
+
+def get_session():
+    """Return the shared HTTP session used for all dataset downloads."""
+    return _SESSION
 
 def create_directory_structure():
     """Create the complete directory structure for the healthcare AI project."""
     base_path = Path("data")
     
     directories = [
-        "data/raw/chest_xray",
-        "data/raw/covid_xray", 
-        "data/raw/brain_mri",
-        "data/raw/blood_tests",
-        "data/raw/cough_audio",
-        "data/raw/diabetes",
-        "data/raw/ecg", 
-        "data/raw/heart_disease",
-        "data/raw/medical_text",
-        "data/raw/skin_cancer",
-        "data/processed/multi_disease/train/NORMAL",
-        "data/processed/multi_disease/train/PNEUMONIA", 
-        "data/processed/multi_disease/train/COVID",
-        "data/processed/multi_disease/test/NORMAL",
-        "data/processed/multi_disease/test/PNEUMONIA",
-        "data/processed/multi_disease/test/COVID"
+        "raw/chest_xray",
+        "raw/covid_xray", 
+        "raw/brain_mri",
+        "raw/blood_tests",
+        "raw/cough_audio",
+        "raw/diabetes",
+        "raw/ecg", 
+        "raw/heart_disease",
+        "raw/medical_text",
+        "raw/skin_cancer",
+        "processed/multi_disease/train/NORMAL",
+        "processed/multi_disease/train/PNEUMONIA", 
+        "processed/multi_disease/train/COVID",
+        "processed/multi_disease/test/NORMAL",
+        "processed/multi_disease/test/PNEUMONIA",
+        "processed/multi_disease/test/COVID"
     ]
     
-    for directory in directories:
-        Path(directory).mkdir(parents=True, exist_ok=True)
-        print(f"✅ Created directory: {directory}")
+    # mkdir(parents=True) creates every parent, so only the deepest paths are needed
+    paths = {base_path / directory for directory in directories}
+    leaves = [path for path in paths if not any(path in other.parents for other in paths)]
+    for path in leaves:
+        path.mkdir(parents=True, exist_ok=True)
+    print(f"✅ Created {len(leaves)} directories under {base_path}/")
 
-def download_file_from_url(url, destination, description="Downloading"):
-    """Download a file from URL with progress bar."""
+def _stream_to(response, fileobj, description, position=0, initial=0):
+    """Copy a streamed response body into fileobj with a progress bar."""
+    total_size = int(response.headers.get('content-length', 0))
+    
+    # Read the raw stream directly and let tqdm count bytes as they are read;
+    # urllib3 only decodes when the server actually set a Content-Encoding
+    response.raw.decode_content = True
+    with tqdm.wrapattr(
+        response.raw,
+        "read",
+        desc=description,
+        initial=initial,
+        total=initial + total_size,
+        position=position,
+        miniters=PROGRESS_INTERVAL,
+        mininterval=0.5,
+        maxinterval=2.0,
+    ) as source:
+        # os.sendfile() can't replace this copy: every source is HTTPS, so the
+        # socket carries TLS records rather than file bytes, and Linux doesn't
+        # accept a socket as sendfile's input fd in the first place.
+        shutil.copyfileobj(source, fileobj, length=CHUNK_SIZE)
+
+def _read_json(path):
+    """Load a small JSON state file, or return {} if it's missing or unreadable."""
     try:
-        response = requests.get(url, stream=True)
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _content_total(response):
+    """Return the full size of the file behind response, or None if unknown."""
+    if response.status_code == 206:
+        # Content-Range: bytes <first>-<last>/<total>
+        total = response.headers.get("Content-Range", "").rpartition("/")[2]
+    else:
+        total = response.headers.get("Content-Length", "")
+    return int(total) if total.isdigit() else None
+
+def _resume_matches(response, start, origin):
+    """Check that a ranged response continues the file described by origin."""
+    return (
+        response.status_code == 206
+        and response.headers.get("Content-Range", "").startswith(f"bytes {start}-")
+        and response.headers.get("ETag") == origin.get("etag")
+        and _content_total(response) == origin.get("length")
+        and response.headers.get("Content-Encoding", "identity") == "identity"
+    )
+
+def _fetch(url, fileobj, description, position=0, archive=False, origin=None):
+    """Append the body of url to fileobj, resuming after any bytes already in it.
+    
+    origin describes the file the bytes already in fileobj came from (its
+    ETag and full size) and is updated in place. A download only resumes when
+    the server reports that same file, so a different mirror's archive is
+    never appended to a partial one; otherwise it starts over from byte 0.
+    origin["offset"] records where this call's bytes began.
+    
+    Archives are already compressed, so they are requested without any
+    transfer encoding; a server that compresses them anyway is still decoded.
+    """
+    if origin is None:
+        origin = {}
+    start = fileobj.seek(0, os.SEEK_END)
+    headers = {}
+    if start and (origin.get("etag") or origin.get("length")):
+        headers["Range"] = f"bytes={start}-"
+        etag = origin.get("etag")
+        if etag and not etag.startswith("W/"):
+            # The server sends the whole file instead if its copy differs
+            headers["If-Range"] = etag
+    if archive:
+        headers["Accept-Encoding"] = "identity"
+    
+    response = _SESSION.get(url, stream=True, headers=headers, timeout=(10, 60))
+    resumed = "Range" in headers and _resume_matches(response, start, origin)
+    if response.status_code == 206 and not resumed:
+        # Part of a different file is no use, so ask for the whole thing
+        response.close()
+        headers.pop("Range")
+        headers.pop("If-Range", None)
+        response = _SESSION.get(url, stream=True, headers=headers, timeout=(10, 60))
+    
+    with response:
         response.raise_for_status()
+        if not resumed:
+            fileobj.seek(0)
+            fileobj.truncate()
+            start = 0
         
-        total_size = int(response.headers.get('content-length', 0))
-        
-        with open(destination, 'wb') as file, tqdm(
-            desc=description,
-            total=total_size,
-            unit='B',
-            unit_scale=True,
-            unit_divisor=1024,
-        ) as progress_bar:
-            for chunk in response.iter_content(chunk_size=8192):
-                size = file.write(chunk)
-                progress_bar.update(size)
+        # Decoded bytes can't be lined up with the server's byte ranges, so
+        # an encoded transfer is never resumed
+        origin.clear()
+        if response.headers.get("Content-Encoding", "identity") == "identity":
+            origin.update(etag=response.headers.get("ETag"), length=_content_total(response))
+        origin["offset"] = start
+        _stream_to(response, fileobj, description, position, initial=start)
+
+def _already_fresh(url, destination):
+    """Check whether destination already holds the current version of url."""
+    if not os.path.exists(destination):
+        return False
+    try:
+        response = _SESSION.head(url, allow_redirects=True, timeout=10)
+        response.raise_for_status()
+    except requests.RequestException:
+        return False
+    
+    cached = _read_json(destination + ".etag")
+    if cached.get("length") != os.path.getsize(destination):
+        # No record of this download, or the file has changed since
+        return False
+    
+    etag = response.headers.get("ETag")
+    if etag and cached.get("etag"):
+        return etag == cached["etag"]
+    # Compare with what the server reported last time rather than the file
+    # size, which differs whenever the response was compressed in transit
+    length = response.headers.get("Content-Length")
+    return length is not None and length == cached.get("content_length")
+
+def _write_sidecar(destination, etag, content_length):
+    """Remember what was downloaded to destination so the next run can skip it."""
+    with open(destination + ".etag", "w") as f:
+        json.dump({
+            "etag": etag,
+            "content_length": content_length,
+            "length": os.path.getsize(destination),
+        }, f)
+
+def _download_small(url, destination):
+    """Download a small file in a single request, without streaming or a progress bar."""
+    try:
+        response = _SESSION.get(url, timeout=(10, 60))
+        response.raise_for_status()
+        Path(destination).write_bytes(response.content)
+        _write_sidecar(destination, response.headers.get("ETag"),
+                       response.headers.get("Content-Length"))
+        print(f"✅ Downloaded: {destination}")
+        return True
+    except Exception as e:
+        print(f"❌ Error downloading {url}: {str(e)}")
+        return False
+
+def _download_part(url, destination, description, position=0):
+    """Download url to destination by way of a resumable destination + ".part".
+    
+    The bytes are only moved into place once complete. If the transfer fails,
+    the partial file is kept together with where it came from (the URL, ETag
+    and size, in destination + ".part.json"), and the next call for the same
+    destination resumes it if the server still has that same file.
+    Returns the origin of the finished file; its "offset" is non-zero when
+    the download was resumed.
+    """
+    part = destination + ".part"
+    state = part + ".json"
+    origin = _read_json(state)
+    try:
+        with open(part, 'a+b', buffering=CHUNK_SIZE) as file:
+            _fetch(url, file, description, position,
+                   archive=destination.endswith(".zip"), origin=origin)
+    except BaseException:
+        with open(state, "w") as f:
+            json.dump(dict(origin, url=url), f)
+        raise
+    os.replace(part, destination)
+    if os.path.exists(state):
+        os.remove(state)
+    return origin
+
+def _resume_first(urls, destination):
+    """Return urls with the source of a partial download of destination first."""
+    source = _read_json(destination + ".part.json").get("url")
+    if source not in urls:
+        return list(urls)
+    return [source] + [url for url in urls if url != source]
+
+def download_file_from_url(url, destination, description="Downloading", position=0):
+    """Download a file from URL with progress bar.
+    
+    A failed attempt is resumed by the next call for the same destination,
+    see _download_part.
+    """
+    try:
+        origin = _download_part(url, destination, description, position)
+        length = origin.get("length")
+        _write_sidecar(destination, origin.get("etag"),
+                       str(length) if length is not None else None)
         
         print(f"✅ Downloaded: {destination}")
         return True
@@ -68,89 +276,285 @@ def download_file_from_url(url, destination, description="Downloading"):
         print(f"❌ Error downloading {url}: {str(e)}")
         return False
 
-def download_chest_xray_dataset():
-    """Download the chest X-ray pneumonia dataset."""
-    print("\n🫁 Downloading Chest X-Ray Pneumonia Dataset...")
+def _member_path(root, info):
+    """Return where an archive member belongs under root, or None to skip it."""
+    # Same rules as ZipFile.extract: drop drive letters, empty, "." and ".."
+    # components so a member can never land outside root.
+    name = os.path.splitdrive(info.filename.replace("\\", "/"))[1]
+    parts = [part for part in name.split("/") if part not in ("", os.curdir, os.pardir)]
+    return os.path.join(root, *parts) if parts else None
+
+def _merge_tree(source, target):
+    """Move everything under source into the directory target.
     
-    # Kaggle chest X-ray dataset
-    url = "https://www.kaggle.com/datasets/paultimothymooney/chest-xray-pneumonia/download"
-    destination = "data/raw/chest_xray/chest-xray-pneumonia.zip"
+    Directories that already exist are merged into rather than replaced, so
+    files in target that source doesn't have are kept; same-named files are
+    overwritten. Raises FileExistsError where a file and a directory clash.
+    """
+    for name in os.listdir(source):
+        src = os.path.join(source, name)
+        dst = os.path.join(target, name)
+        dst_is_dir = os.path.isdir(dst) and not os.path.islink(dst)
+        if os.path.isdir(src) and dst_is_dir:
+            _merge_tree(src, dst)
+        elif dst_is_dir or (os.path.isdir(src) and os.path.lexists(dst)):
+            raise FileExistsError(f"{dst} is in the way of the extracted {name}")
+        else:
+            os.replace(src, dst)
+
+def _use_zlib_ng(source, zlib_ng):
+    """Have the zipfile member source inflate with zlib-ng, if that's safe.
     
-    # Alternative direct download links
-    alternative_urls = [
-        "https://prod-dcd-datasets-cache-zipfiles.s3.eu-west-1.amazonaws.com/rscbjbr9sj-2.zip",
-        "https://storage.googleapis.com/kagglesdsdata/datasets/17810/23812/chest_xray.zip"
-    ]
+    Only done while nothing has been read from source yet; otherwise, or if
+    ZipExtFile no longer looks as expected, the stdlib zlib stays in use.
+    """
+    # ZipExtFile._decompressor checked against CPython 3.8 to 3.13
+    if not hasattr(source, "_decompressor"):
+        return
+    try:
+        unread = source.tell() == 0
+    except (OSError, ValueError):
+        return
+    if unread:
+        source._decompressor = zlib_ng.decompressobj(-15)
+
+def _extract_all(archive_path, extract_to):
+    """Extract every member of the zip at archive_path in parallel across CPU cores.
     
-    success = False
-    for i, url in enumerate([url] + alternative_urls):
-        print(f"Trying download source {i+1}...")
-        if download_file_from_url(url, destination, "Chest X-Ray Dataset"):
-            success = True
-            break
+    Members are unpacked into a staging directory inside extract_to and only
+    moved into place once all of them have succeeded, so a failed extraction
+    never touches extract_to. They are then merged into whatever is there
+    already; nothing the archive doesn't contain is deleted.
+    """
+    import zipfile  # only needed when extracting, keep module import cheap
+    try:
+        from zlib_ng import zlib_ng  # optional, much faster inflate than zlib
+    except ImportError:
+        zlib_ng = None
     
-    if success:
-        # Extract the dataset
+    staging = tempfile.mkdtemp(prefix=".extracting-", dir=extract_to)
+    try:
+        with zipfile.ZipFile(archive_path) as zip_ref:
+            infos = zip_ref.infolist()
+        
+        # Create every directory up front so workers never race on makedirs
+        jobs = []
+        for info in infos:
+            path = _member_path(staging, info)
+            if path is None:
+                continue
+            if info.is_dir():
+                os.makedirs(path, exist_ok=True)
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                jobs.append((info, path))
+        
+        # A ZipFile must not be shared between threads, so each worker opens
+        # its own on the archive path; inflating releases the GIL.
+        local = threading.local()
+        opened = []
+        
+        def extract(job):
+            zip_ref = getattr(local, "zip_ref", None)
+            if zip_ref is None:
+                zip_ref = local.zip_ref = zipfile.ZipFile(archive_path)
+                opened.append(zip_ref)
+            info, path = job
+            with zip_ref.open(info) as source, open(path, "wb") as target:
+                if zlib_ng is not None and info.compress_type == zipfile.ZIP_DEFLATED:
+                    # Only this member's decompressor changes; the zipfile
+                    # module itself keeps the stdlib zlib.
+                    _use_zlib_ng(source, zlib_ng)
+                shutil.copyfileobj(source, target, CHUNK_SIZE)
+        
         try:
-            with zipfile.ZipFile(destination, 'r') as zip_ref:
-                zip_ref.extractall("data/raw/chest_xray/")
-            print("✅ Extracted chest X-ray dataset")
-            os.remove(destination)  # Clean up zip file
-        except Exception as e:
-            print(f"❌ Error extracting: {str(e)}")
-    else:
-        print("❌ Failed to download chest X-ray dataset from all sources")
-        print("📋 Manual download instructions:")
-        print("1. Go to: https://www.kaggle.com/datasets/paultimothymooney/chest-xray-pneumonia")
-        print("2. Download the dataset")
-        print("3. Extract to: data/raw/chest_xray/")
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                futures = [executor.submit(extract, job) for job in jobs]
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+        finally:
+            for zip_ref in opened:
+                zip_ref.close()
+        
+        _merge_tree(staging, extract_to)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
 
-def download_covid_dataset():
-    """Download the COVID-19 radiography dataset."""
-    print("\n🦠 Downloading COVID-19 Radiography Dataset...")
+def download_and_extract(urls, destination, extract_to, description="Downloading", position=0):
+    """Download a zip archive from the first working URL and extract it.
     
-    # COVID-19 Radiography Database
-    urls = [
-        "https://www.kaggle.com/datasets/tawsifurrahman/covid19-radiography-database/download",
-        "https://prod-dcd-datasets-cache-zipfiles.s3.eu-west-1.amazonaws.com/8h65ywd2jr-3.zip"
-    ]
+    The archive is downloaded to destination (resumably, see _download_part)
+    and removed once it has been extracted. A partial download left by an
+    earlier run is resumed from the source it came from, which is tried
+    first; any other source starts the download over.
+    """
+    os.makedirs(extract_to, exist_ok=True)
+    for i, url in enumerate(_resume_first(urls, destination)):
+        print(f"Trying {description} source {i+1}...")
+        while True:
+            try:
+                origin = _download_part(url, destination, description, position)
+            except Exception as e:
+                # Keep what arrived so a later attempt can resume from it
+                print(f"❌ Error downloading {url}: {str(e)}")
+                break
+            incomplete = os.path.join(extract_to, INCOMPLETE_MARKER)
+            with open(incomplete, "w") as f:
+                json.dump({"url": url}, f)
+            try:
+                _extract_all(destination, extract_to)
+            except FileExistsError as e:
+                # The download is fine, keep it until the clash is sorted out
+                print(f"❌ Not extracting {destination}: {str(e)}")
+                return False
+            except Exception as e:
+                print(f"❌ Error extracting {url}: {str(e)}")
+            else:
+                with open(os.path.join(extract_to, COMPLETE_MARKER), "w") as f:
+                    json.dump({"url": url}, f)
+                os.remove(incomplete)
+                os.remove(destination)
+                print(f"✅ Extracted {description} to {extract_to}")
+                return True
+            
+            # A complete but unusable download must not be resumed from.
+            # If it was stitched onto an earlier partial transfer, the
+            # join may be the problem, so try this source once from scratch.
+            os.remove(destination)
+            if not origin.get("offset"):
+                break
+            print(f"Retrying {description} source {i+1} from the start...")
+    return False
+
+def _already_extracted(extract_to, expected_tree=None):
+    """Return True if an archive's contents are already in extract_to.
     
-    destination = "data/raw/covid_xray/covid-radiography.zip"
+    Besides the marker left by a completed extraction, a non-empty
+    expected_tree counts, since that is what an extraction by hand or by an
+    older version of this script leaves behind. The marker is then written
+    so later runs don't have to look again. A tree this script left half
+    extracted never counts.
+    """
+    marker = os.path.join(extract_to, COMPLETE_MARKER)
+    if os.path.exists(marker):
+        return True
+    if os.path.exists(os.path.join(extract_to, INCOMPLETE_MARKER)):
+        return False
+    if not expected_tree or not os.path.isdir(expected_tree) or not os.listdir(expected_tree):
+        return False
+    with open(marker, "w") as f:
+        json.dump({"found": expected_tree}, f)
+    return True
+
+def download_dataset(urls, destination, description, extract_to=None, expected_tree=None,
+                     manual_url=None, position=0):
+    """Download a dataset from the first working URL and optionally extract it.
     
-    success = False
-    for i, url in enumerate(urls):
-        print(f"Trying COVID dataset source {i+1}...")
-        if download_file_from_url(url, destination, "COVID-19 Dataset"):
-            success = True
-            break
+    Archives (extract_to given) are downloaded to destination, extracted
+    into extract_to and then removed; an interrupted download is resumed
+    from destination + ".part". They are skipped once a previous run has
+    finished extracting them, or when expected_tree already holds files;
+    plain files are skipped when the server reports the same ETag or size
+    as the recorded download.
     
-    if success:
-        try:
-            with zipfile.ZipFile(destination, 'r') as zip_ref:
-                zip_ref.extractall("data/raw/covid_xray/")
-            print("✅ Extracted COVID-19 dataset")
-            os.remove(destination)
-        except Exception as e:
-            print(f"❌ Error extracting: {str(e)}")
+    Plain files are the small tabular datasets and are fetched in one
+    request; large single files should go through download_file_from_url.
+    """
+    if extract_to:
+        if _already_extracted(extract_to, expected_tree):
+            print(f"✅ {description} already present, skipping")
+            return True
+        if download_and_extract(urls, destination, extract_to, description, position):
+            return True
     else:
-        print("❌ Failed to download COVID dataset")
+        for i, url in enumerate(urls):
+            if _already_fresh(url, destination):
+                print(f"✅ {description} already up to date, skipping")
+                return True
+            print(f"Trying {description} source {i+1}...")
+            if _download_small(url, destination):
+                return True
+    
+    print(f"❌ Failed to download {description} from all sources")
+    if manual_url:
         print("📋 Manual download instructions:")
-        print("1. Go to: https://www.kaggle.com/datasets/tawsifurrahman/covid19-radiography-database")
-        print("2. Download and extract to: data/raw/covid_xray/")
+        print(f"1. Go to: {manual_url}")
+        print("2. Download the dataset")
+        if extract_to:
+            print(f"3. Extract to: {extract_to}")
+        else:
+            print(f"3. Save as: {destination}")
+    return False
 
-def download_sample_datasets():
-    """Download smaller sample datasets for testing."""
-    print("\n🩺 Downloading Sample Medical Datasets...")
-    
-    # Heart disease dataset (CSV)
-    heart_url = "https://archive.ics.uci.edu/ml/machine-learning-databases/heart-disease/processed.cleveland.data"
-    if download_file_from_url(heart_url, "data/raw/heart_disease/heart.csv", "Heart Disease Data"):
-        print("✅ Heart disease dataset downloaded")
+# Datasets to download:
+# (urls, destination, description, extract_to, expected_tree, manual_url)
+DATASETS = [
+    (
+        [
+            "https://www.kaggle.com/datasets/paultimothymooney/chest-xray-pneumonia/download",
+            "https://prod-dcd-datasets-cache-zipfiles.s3.eu-west-1.amazonaws.com/rscbjbr9sj-2.zip",
+            "https://storage.googleapis.com/kagglesdsdata/datasets/17810/23812/chest_xray.zip",
+        ],
+        "data/raw/chest_xray/chest-xray-pneumonia.zip",
+        "Chest X-Ray Dataset",
+        "data/raw/chest_xray/",
+        "data/raw/chest_xray/chest_xray/train",
+        "https://www.kaggle.com/datasets/paultimothymooney/chest-xray-pneumonia",
+    ),
+    (
+        [
+            "https://www.kaggle.com/datasets/tawsifurrahman/covid19-radiography-database/download",
+            "https://prod-dcd-datasets-cache-zipfiles.s3.eu-west-1.amazonaws.com/8h65ywd2jr-3.zip",
+        ],
+        "data/raw/covid_xray/covid-radiography.zip",
+        "COVID-19 Dataset",
+        "data/raw/covid_xray/",
+        "data/raw/covid_xray/COVID-19_Radiography_Dataset",
+        "https://www.kaggle.com/datasets/tawsifurrahman/covid19-radiography-database",
+    ),
+    (
+        ["https://archive.ics.uci.edu/ml/machine-learning-databases/heart-disease/processed.cleveland.data"],
+        "data/raw/heart_disease/heart.csv",
+        "Heart Disease Data",
+        None,
+        None,
+        "https://archive.ics.uci.edu/ml/datasets/heart+disease",
+    ),
+    (
+        ["https://raw.githubusercontent.com/jbrownlee/Datasets/master/pima-indians-diabetes.csv"],
+        "data/raw/diabetes/diabetes.csv",
+        "Diabetes Data",
+        None,
+        None,
+        "https://www.kaggle.com/datasets/uciml/pima-indians-diabetes-database",
+    ),
+]
+
+def download_all(max_workers=4):
+    """Download every dataset in DATASETS concurrently and return the success count."""
+    # Downloads are network-bound and independent, so run them concurrently;
+    # each worker gets its own progress bar line via position=i.
+    print("\n📥 Downloading datasets...")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            (dataset[2], executor.submit(download_dataset, *dataset, position=i))
+            for i, dataset in enumerate(DATASETS)
+        ]
     
-    # Diabetes dataset
-    diabetes_url = "https://raw.githubusercontent.com/jbrownlee/Datasets/master/pima-indians-diabetes.csv"
-    if download_file_from_url(diabetes_url, "data/raw/diabetes/diabetes.csv", "Diabetes Data"):
-        print("✅ Diabetes dataset downloaded")
+    # One dataset raising must not stop the others from being counted
+    ready = 0
+    for description, future in futures:
+        try:
+            ready += bool(future.result())
+        except Exception as e:
+            print(f"❌ Error downloading {description}: {str(e)}")
+    print(f"✅ {ready}/{len(DATASETS)} datasets ready")
+    return ready
 
 def create_data_info_file():
     """Create an information file about the datasets."""
@@ -239,9 +643,14 @@ data/
 Happy coding! 🚀
 """
     
-    with open("DATA_INFO.md", "w") as f:
-        f.write(info_content)
-    print("✅ Created DATA_INFO.md with complete setup instructions")
+    # Only rewrite the file when its content actually changed; explicit UTF-8
+    # keeps the emoji from depending on the platform's default encoding
+    path = Path("DATA_INFO.md")
+    if not path.exists() or path.read_text(encoding="utf-8") != info_content:
+        path.write_text(info_content, encoding="utf-8")
+        print("✅ Created DATA_INFO.md with complete setup instructions")
+    else:
+        print("✓ DATA_INFO.md already up to date")
 
 def main():
     """Main function to download all datasets."""
@@ -252,9 +661,7 @@ def main():
     create_directory_structure()
     
     # Download datasets
-    download_chest_xray_dataset()
-    download_covid_dataset() 
-    download_sample_datasets()
+    download_all()
     
     # Create information file
     create_data_info_file()
@@ -266,14 +673,12 @@ def main():
 
 if __name__ == "__main__":
     # Check if required packages are installed
-    required_packages = ['requests', 'tqdm', 'gdown']
-    missing_packages = []
-    
-    for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
-            missing_packages.append(package)
+    # find_spec checks for a package without importing it
+    required_packages = ['requests', 'tqdm']
+    missing_packages = [
+        package for package in required_packages
+        if importlib.util.find_spec(package) is None
+    ]
     
     if missing_packages:
         print(f"❌ Missing packages: {missing_packages}")
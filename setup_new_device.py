@@ -18,6 +18,24 @@ import sys
 import os
 from pathlib import Path
 
+PIP_INSTALL_ARGS = [
+    "install", "--no-input", "--disable-pip-version-check", "--prefer-binary",
+]
+
+def _pip_install(packages):
+    """Install packages with pip, in-process when its internal API is available."""
+    args = PIP_INSTALL_ARGS + list(packages)
+    try:
+        # Running pip in this interpreter skips a fork and a fresh pip import
+        from pip._internal.cli.main import main as pip_main
+        status = pip_main(args)
+    except Exception:
+        # pip._internal is private and may change, so fall back to a subprocess
+        subprocess.check_call([sys.executable, "-m", "pip"] + args)
+        return
+    if status != 0:
+        raise subprocess.CalledProcessError(status, ["pip"] + args)
+
 def install_requirements():
     """Install required packages for the healthcare AI platform."""
     print("📦 Installing required packages...")
@@ -30,13 +48,19 @@ def install_requirements():
         "requests", "tqdm", "gdown"
     ]
     
-    for package in basic_packages:
-        try:
-            print(f"Installing {package}...")
-            subprocess.check_call([sys.executable, "-m", "pip", "install", package])
-            print(f"✅ {package} installed successfully")
-        except subprocess.CalledProcessError:
-            print(f"❌ Failed to install {package}")
+    # One pip run pays the startup and resolver cost once for every package
+    try:
+        _pip_install(basic_packages)
+    except subprocess.CalledProcessError:
+        # Fall back to one package at a time to find out which one failed
+        print("⚠️ Batch install failed, retrying packages individually...")
+        for package in basic_packages:
+            try:
+                print(f"Installing {package}...")
+                _pip_install([package])
+                print(f"✅ {package} installed successfully")
+            except subprocess.CalledProcessError:
+                print(f"❌ Failed to install {package}")
     
     print("✅ Package installation completed!")
 
@@ -102,9 +126,14 @@ Run these cells in order:
 Happy coding! 🏥🤖
 """
     
-    with open("QUICK_START.md", "w") as f:
-        f.write(guide_content)
-    print("✅ Created QUICK_START.md")
+    # Only rewrite the file when its content actually changed; explicit UTF-8
+    # keeps the emoji from depending on the platform's default encoding
+    path = Path("QUICK_START.md")
+    if not path.exists() or path.read_text(encoding="utf-8") != guide_content:
+        path.write_text(guide_content, encoding="utf-8")
+        print("✅ Created QUICK_START.md")
+    else:
+        print("✓ QUICK_START.md already up to date")
 
 def main():
     """Main setup function."""